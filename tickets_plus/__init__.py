@@ -16,8 +16,7 @@ Typical usage example:
     #!/usr/bin/env python3
     import asyncio
     import tickets_plus
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(tickets_plus.start_bot(config))
+    asyncio.run(tickets_plus.start_bot(config))
     ```
 """
 # License: EPL-2.0
@@ -28,11 +27,15 @@ Typical usage example:
 # in the Eclipse Public License, v. 2.0 are satisfied: GPL-3.0-only OR
 # If later approved by the Initial Contributor, GPL-3.0-or-later.
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 import signal
 import ssl
 import sys
+import uuid
 
 import discord
 import sqlalchemy
@@ -54,7 +57,7 @@ def sigint_handler(sign, frame):
 signal.signal(signal.SIGINT, sigint_handler)
 
 
-async def start_bot(stat_data: config.MiniConfig = config.MiniConfig()) -> None:  # shush deepsource # skipcq: FLK-E124
+async def start_bot(stat_data: config.MiniConfig | None = None) -> None:
     """Sets up the bot and starts it. Coroutine.
 
     This function uses the existing .json files to set up the bot.
@@ -67,36 +70,45 @@ async def start_bot(stat_data: config.MiniConfig = config.MiniConfig()) -> None:
             If None, a new one will be created.
     """
     print("Setting up bot...")
+    if stat_data is None:
+        stat_data = config.MiniConfig()
     try:
         # Set up logging
         dt_fmr = "%Y-%m-%d %H:%M:%S"
         const.HANDLER.setFormatter(logging.Formatter("%(asctime)s:%(levelname)s:%(name)s: %(message)s", dt_fmr))
 
+        log_handlers: list[logging.Handler] = [const.HANDLER]
+        verbose = os.environ.get("TICKETS_PLUS_VERBOSE", "false").lower() == "true"
+        if verbose:
+            log_handlers.append(logging.StreamHandler())
+
+        # File and stream writes happen on the listener thread, not the event loop
+        log_queue = queue.SimpleQueue()
+        queue_handler = logging.handlers.QueueHandler(log_queue)
+        log_listener = logging.handlers.QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+        log_listener.start()
+        atexit.register(log_listener.stop)
+
         # Set up bot logging
         logging.root.setLevel(logging.INFO)
-        logging.root.addHandler(const.HANDLER)
+        logging.root.addHandler(queue_handler)
 
         # Set up discord.py logging
         dscrd_logger = logging.getLogger("discord")
         dscrd_logger.setLevel(logging.INFO)
-        dscrd_logger.addHandler(const.HANDLER)
+        dscrd_logger.addHandler(queue_handler)
 
         # Set up sqlalchemy logging
         sql_logger = logging.getLogger("sqlalchemy.engine")
         sql_logger.setLevel(logging.WARNING)
-        sql_logger.addHandler(const.HANDLER)
+        sql_logger.addHandler(queue_handler)
 
         sql_pool_logger = logging.getLogger("sqlalchemy.pool")
         sql_pool_logger.setLevel(logging.WARNING)
-        sql_pool_logger.addHandler(const.HANDLER)
+        sql_pool_logger.addHandler(queue_handler)
 
-        if os.environ.get("TICKETS_PLUS_VERBOSE", "false").lower() == "true":
+        if verbose:
             logging.info("Enabling verbose logging.")
-            handler2 = logging.StreamHandler()
-            logging.root.addHandler(handler2)
-            dscrd_logger.addHandler(handler2)
-            sql_logger.addHandler(handler2)
-            sql_pool_logger.addHandler(handler2)
         logging.info("Logging set up.")
     # pylint: disable=broad-exception-caught # skipcq: PYL-W0718
     except Exception as exc:
@@ -110,27 +122,38 @@ async def start_bot(stat_data: config.MiniConfig = config.MiniConfig()) -> None:
     # Set up database
     try:
         logging.info("Creating engine...")
+        engine_args = {
+            "pool_size": stat_data.getitem("db_pool_size", 10),
+            "max_overflow": stat_data.getitem("db_max_overflow", 20),
+            "pool_timeout": stat_data.getitem("db_pool_timeout", 30),
+            "pool_recycle": stat_data.getitem("db_pool_recycle", 600),
+            "pool_pre_ping": True,
+        }
         if "asyncpg" in stat_data.getitem("dbtype"):
-            engine = sa_asyncio.create_async_engine(stat_data.get_url(),
-                                                    pool_size=10,
-                                                    max_overflow=-1,
-                                                    pool_recycle=600,
-                                                    connect_args={"server_settings": {
-                                                        "jit": "off"
-                                                    }})
+            engine_args["connect_args"] = {
+                "server_settings": {
+                    "jit": "off"
+                },
+                # asyncpg's own cache, and the one of SQLAlchemy's asyncpg adapter
+                "statement_cache_size": stat_data.getitem("db_statement_cache_size", 100),
+                "prepared_statement_cache_size": stat_data.getitem("db_prepared_statement_cache_size", 100),
+            }
+            if stat_data.getitem("db_pgbouncer", False):
+                # Prepared statements don't survive pgbouncer's transaction pooling
+                engine_args["connect_args"]["statement_cache_size"] = 0
+                engine_args["connect_args"]["prepared_statement_cache_size"] = 0
+                # Statements are still prepared, so names must not clash across server connections
+                engine_args["connect_args"]["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid.uuid4()}__"
+        engine = sa_asyncio.create_async_engine(stat_data.get_url(), **engine_args)
+        if stat_data.getitem("db_ensure_tables", True):
+            logging.info("Engine created. Ensuring tables...")
+            async with engine.begin() as conn:
+                await conn.execute(sqlalchemy.schema.CreateSchema("tickets_plus", if_not_exists=True))
+                await conn.run_sync(models.Base.metadata.create_all)
+                await conn.commit()
+            logging.info("Tables ensured. Starting bot...")
         else:
-            engine = sa_asyncio.create_async_engine(
-                stat_data.get_url(),
-                pool_size=10,
-                max_overflow=-1,
-                pool_recycle=600,
-            )
-        logging.info("Engine created. Ensuring tables...")
-        async with engine.begin() as conn:
-            await conn.execute(sqlalchemy.schema.CreateSchema("tickets_plus", if_not_exists=True))
-            await conn.run_sync(models.Base.metadata.create_all)
-            await conn.commit()
-        logging.info("Tables ensured. Starting bot...")
+            logging.info("Engine created. Skipping table creation. Starting bot...")
     # pylint: disable=broad-exception-caught # skipcq: PYL-W0718
     except Exception as exc:
         logging.exception("Database setup failed. Aborting startup.")
@@ -142,6 +165,7 @@ async def start_bot(stat_data: config.MiniConfig = config.MiniConfig()) -> None:
     try:
         bot_instance = bot.TicketsPlusBot(
             db_engine=engine,
+            confg=stat_data,
             intents=const.INTENTS,
             command_prefix=commands.when_mentioned,
             status=discord.Status.online,
@@ -158,9 +182,8 @@ async def start_bot(stat_data: config.MiniConfig = config.MiniConfig()) -> None:
 
     # Tornado API setup
     try:
-        api_routes = routes.make_app(bot_instance)
         tls_ctx = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
-        tls_ctx.options |= ssl.OP_NO_TLSv1_2
+        tls_ctx.minimum_version = ssl.TLSVersion.TLSv1_3
         tls_ctx.options |= ssl.OP_CIPHER_SERVER_PREFERENCE
         tls_ctx.options |= ssl.OP_NO_RENEGOTIATION
         try:
@@ -178,6 +201,7 @@ async def start_bot(stat_data: config.MiniConfig = config.MiniConfig()) -> None:
             frbddn = ["thequickbrownfoxjumpedoverthelazydog", ""]
             if tkn is None or tkn in frbddn:
                 raise ValueError("API Auth token not set.")
+            api_routes = routes.make_app(bot_instance, tkn)
             logging.info("SSL cert and key loaded. Starting API...")
             api_routes.listen(stat_data.getitem("https_port"), protocol="https", ssl_options=tls_ctx)
     # pylint: disable=broad-exception-caught # skipcq: PYL-W0718
@@ -19,23 +19,34 @@ Typical usage example:
 # If later approved by the Initial Contributor, GPL-3.0-or-later.
 
 import asyncio
+import sys
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 import tickets_plus
-from tickets_plus.database import config, const
+from tickets_plus.database import const
 
 
 def main():
     """Start the bot
 
     Adjust the event loop policy if we're on Windows and psycopg3.
+    Use uvloop for the event loop if it is installed.
     Then, run the bot until it's done.
     """
     print(f"Starting Tickets+ {const.VERSION}")
-    cnfg = config.MiniConfig()
-    loop = asyncio.get_event_loop()
-    # We don't need to pass the config to start_bot, but we do it anyway
+    # start_bot loads the config itself, so it is parsed only once
     print("Entering event loop.")
-    loop.run_until_complete(tickets_plus.start_bot(cnfg))
+    loop_factory = None
+    if uvloop is not None:
+        loop_factory = uvloop.new_event_loop
+    elif sys.platform == "win32":
+        # psycopg3 can't run on the default proactor loop
+        loop_factory = asyncio.SelectorEventLoop
+    asyncio.run(tickets_plus.start_bot(), loop_factory=loop_factory)
 
 
 if __name__ == "__main__":
@@ -20,6 +20,8 @@ Typical usage example:
 # in the Eclipse Public License, v. 2.0 are satisfied: GPL-3.0-only OR
 # If later approved by the Initial Contributor, GPL-3.0-or-later.
 
+import functools
+import hmac
 import json
 
 import discord
@@ -31,22 +33,75 @@ from tickets_plus.cogs import events
 from tickets_plus.database import models
 
 
+@functools.cache
+def _error_body(message: str) -> bytes:
+    """Encode an error response body.
+
+    The messages are fixed strings, so each one is encoded only once.
+
+    Args:
+        message: The error message.
+
+    Returns:
+        bytes: The JSON encoded error body.
+    """
+    return json.dumps({"error": message}).encode("utf-8")
+
+
+async def _create_ticket(
+    bot_instance: bot.TicketsPlusBot,
+    guild: discord.Guild,
+    channel: discord.TextChannel,
+    user: discord.User | None,
+) -> None:
+    """Creates an integrated ticket in the background.
+
+    Uses a connection of its own, as the request is already finished.
+
+    Args:
+        bot_instance: The bot object.
+        guild: The guild the ticket is in.
+        channel: The ticket channel.
+        user: The user that opened the ticket, if known.
+    """
+    async with bot_instance.get_connection() as db:
+        gld = await db.get_guild(
+            guild.id,
+            (
+                orm.selectinload(models.Guild.observers_roles),
+                orm.selectinload(models.Guild.community_roles),
+                orm.selectinload(models.Guild.community_pings),
+                orm.selectinload(models.Guild.ticket_bots),
+            ),
+        )
+        await events.Events.ticket_creation(bot_instance, db, (guild, gld), channel, user)
+
+
 class BotHandler(web.RequestHandler):
     """Handler for the bot to send data to the app.
 
-    This handler is used to receive data into the bot
+    This handler is used to receive data into the bot.
+    The bot is bound to the class once, using `bind`.
     """
 
-    def initialize(self, bot_instance: bot.TicketsPlusBot) -> None:
-        """Initialize the handler.
+    SUPPORTED_METHODS = ("POST",)
+    _bt: bot.TicketsPlusBot
+    _auth_token: bytes
 
-        Initialize the handler with the bot object.
+    @classmethod
+    def bind(cls, bot_instance: bot.TicketsPlusBot, auth_token: bytes) -> None:
+        """Bind the handlers to the bot.
+
+        Sets the shared state once, instead of on every request.
+        Applies to all the handler subclasses.
 
         Args:
             bot_instance: The bot object.
+            auth_token: The expected API authentication token, encoded.
+                Read from the config once, when the app is made.
         """
-        self._bt = bot_instance
-        self.SUPPORTED_METHODS = ("POST",)  # pylint: disable=invalid-name
+        cls._bt = bot_instance
+        cls._auth_token = auth_token
 
     def set_default_headers(self) -> None:
         """Sets the return type to JSON.
@@ -64,39 +119,46 @@ class BotHandler(web.RequestHandler):
             "manifest-src 'none'")
         self.set_header("X-Content-Type-Options", "nosniff")
 
+    def _fail(self, status: int, message: str) -> None:
+        """Finish the request with an error.
+
+        Args:
+            status: The HTTP status code.
+            message: The reason, sent as the status reason and error body.
+        """
+        self.set_status(status, message)
+        self.write(_error_body(message))
+        self.finish()
+
     # pylint: disable=invalid-overridden-method
     async def prepare(self) -> None:
         """Prepare the handler.
 
         Check if the request is authorized.
         """
-        if self.request.body == b"":
-            self.set_status(400, "No data provided.")
-            self.write({"error": "No data provided."})
-            self.finish()
-            return
-        if self.request.headers.get("ticketsplus-api-auth") is None:
-            self.set_status(401, "No authentication token provided.")
-            self.write({"error": "No authentication token provided."})
-            self.finish()
-            return
-        if self.request.headers.get("ticketsplus-api-auth") != self._bt.stat_confg.getitem("auth_token"):
-            self.set_status(401, "Invalid authentication token.")
-            self.write({"error": "Invalid authentication token."})
-            self.finish()
-            return
-        if self.request.headers.get("Content-Type") is None:
-            self.set_status(400, "No Content-Type header provided.")
-            self.write({"error": "No Content-Type header provided."})
-            self.finish()
-            return
-        if self.request.headers.get("Content-Type") == "application/json":
-            self.args = json.loads(self.request.body.decode("utf-8"))
+        headers = self.request.headers
+        body = self.request.body
+        auth_token = headers.get("ticketsplus-api-auth")
+        content_type = headers.get("Content-Type")
+        if body == b"":
+            self._fail(400, "No data provided.")
+        elif auth_token is None:
+            self._fail(401, "No authentication token provided.")
+        # Constant-time, so the token can't be guessed from response timings
+        elif not hmac.compare_digest(auth_token.encode("utf-8"), self._auth_token):
+            self._fail(401, "Invalid authentication token.")
+        elif content_type is None:
+            self._fail(400, "No Content-Type header provided.")
+        elif content_type != "application/json":
+            self._fail(400, "Invalid Content-Type header provided.")
+        else:
+            try:
+                # json accepts the raw bytes and detects the encoding itself
+                self.args = json.loads(body)
+            except ValueError:
+                self._fail(400, "Invalid JSON data provided.")
+                return
             await self._bt.wait_until_ready()
-            return
-        self.set_status(400, "Invalid Content-Type header provided.")
-        self.write({"error": "Invalid Content-Type header provided."})
-        self.finish()
 
 
 class TicketHandler(BotHandler):
@@ -113,57 +175,43 @@ class TicketHandler(BotHandler):
 
         Handle the request and create the ticket.
         Parses the POST data.
+        The ticket is created in the background, after responding.
 
         Args:
             guild_id (str): The discord ID of the guild.
             user_id (str): The user ID of the user.
             ticket_channel_id (str): The ID of the channel
         """
-        async with self._bt.get_connection() as db:
-            try:
-                guild_id = int(self.args["guild_id"])
-                user_id = int(self.args["user_id"])
-                ticket_channel_id = int(self.args["ticket_channel_id"])
-                is_new_ticket = bool(self.args["is_new_ticket"])
-            except (ValueError, KeyError):
-                self.set_status(400, "Missing or invalid parameters.")
-                self.write({"error": "Missing or invalid parameters."})
-                self.finish()
-                return
-            if not is_new_ticket:
-                self.set_status(202, "Not a new ticket.")
-                self.write({"notice": "Not a new ticket."})
-                self.finish()
-                return
-            guild = self._bt.get_guild(guild_id)
-            if guild is None:
-                self.set_status(404, "Guild not found.")
-                self.write({"error": "Guild not found."})
-                self.finish()
-                return
-            gld = await db.get_guild(
-                guild_id,
-                (
-                    orm.selectinload(models.Guild.observers_roles),
-                    orm.selectinload(models.Guild.community_roles),
-                    orm.selectinload(models.Guild.community_pings),
-                ),
-            )
-            if not gld.integrated:
-                self.set_status(409, "Guild not integrated.")
-                self.write({"error": "Guild not integrated."})
-                self.finish()
-                return
-            channel = guild.get_channel(ticket_channel_id)
-            if channel is None or not isinstance(channel, discord.TextChannel):
-                self.set_status(404, "Channel not found.")
-                self.write({"error": "Channel not found."})
-                self.finish()
-                return
-            user = self._bt.get_user(user_id)
-            self.set_status(200, "OK")
+        try:
+            guild_id = int(self.args["guild_id"])
+            user_id = int(self.args["user_id"])
+            ticket_channel_id = int(self.args["ticket_channel_id"])
+            is_new_ticket = bool(self.args["is_new_ticket"])
+        except (ValueError, KeyError):
+            self._fail(400, "Missing or invalid parameters.")
+            return
+        if not is_new_ticket:
+            self.set_status(202, "Not a new ticket.")
+            self.write({"notice": "Not a new ticket."})
             self.finish()
-            await events.Events.ticket_creation(self, db, (guild, gld), channel, user)
+            return
+        guild = self._bt.get_guild(guild_id)
+        if guild is None:
+            self._fail(404, "Guild not found.")
+            return
+        async with self._bt.get_connection() as db:
+            gld = await db.get_guild(guild_id)
+        if not gld.integrated:
+            self._fail(409, "Guild not integrated.")
+            return
+        channel = guild.get_channel(ticket_channel_id)
+        if channel is None or not isinstance(channel, discord.TextChannel):
+            self._fail(404, "Channel not found.")
+            return
+        user = self._bt.get_user(user_id)
+        self.set_status(200, "OK")
+        self.finish()
+        self._bt.run_in_background(_create_ticket(self._bt, guild, channel, user))
 
 
 class OverrideHandler(BotHandler):
@@ -187,18 +235,15 @@ class OverrideHandler(BotHandler):
             channel_id = int(self.args["channel_id"])
             message = self.args["message"]
         except (ValueError, KeyError):
-            self.set_status(400, "Missing or invalid parameters.")
-            self.finish()
+            self._fail(400, "Missing or invalid parameters.")
             return
         guild = self._bt.get_guild(guild_id)
         if guild is None:
-            self.set_status(404, "Guild not found.")
-            self.finish()
+            self._fail(404, "Guild not found.")
             return
         channel = guild.get_channel(channel_id)
         if channel is None or not isinstance(channel, discord.TextChannel):
-            self.set_status(404, "Channel not found.")
-            self.finish()
+            self._fail(404, "Channel not found.")
             return
         await channel.send(message)
         self.set_status(200, "OK")
@@ -10,7 +10,7 @@ Typical usage example:
     from tickets_plus import bot
 
     bot_instance = bot.TicketsPlusBot(...)
-    app = routes.make_app(bot_instance)
+    app = routes.make_app(bot_instance, auth_token)
     app.listen(443, ssl_options=...)
     ```
 """
@@ -28,17 +28,19 @@ from tickets_plus import bot
 from tickets_plus.api import handlers
 
 
-def make_app(bot_instance: bot.TicketsPlusBot) -> web.Application:
+def make_app(bot_instance: bot.TicketsPlusBot, auth_token: str) -> web.Application:
     """Prepare the API.
 
-    Maps the routes to the handlers. Provides the bot object to the handlers.
+    Maps the routes to the handlers. Binds the bot object to the handlers.
+    The authentication token is encoded here, once.
 
     Args:
         bot_instance: The bot object.
+        auth_token: The API authentication token. Must already be validated.
     """
-    data = {"bot_instance": bot_instance}
+    handlers.BotHandler.bind(bot_instance, auth_token.encode("utf-8"))
     routes = [
-        (r"/", handlers.TicketHandler, data),
-        (r"/override", handlers.OverrideHandler, data),
+        web.url(r"/", handlers.TicketHandler, name="ticket"),
+        web.url(r"/override", handlers.OverrideHandler, name="override"),
     ]
     return web.Application(routes)
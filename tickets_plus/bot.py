@@ -18,7 +18,9 @@ Typical usage example:
 # in the Eclipse Public License, v. 2.0 are satisfied: GPL-3.0-only OR
 # If later approved by the Initial Contributor, GPL-3.0-or-later.
 
+import asyncio
 import logging
+from typing import Any, Coroutine
 
 import discord
 from discord.ext import commands
@@ -39,15 +41,21 @@ class TicketsPlusBot(commands.AutoShardedBot):
     Attributes:
         stat_confg: The config for the bot.
         sessions: The database session maker.
+        guild_cache: The guild configuration cache shared by all connections.
+            None if disabled with a guild_cache_ttl of 0.
+        bg_tasks: The background tasks still running.
+            Awaited when the bot closes.
     """
 
     stat_confg: config.MiniConfig
     sessions: sa_asyncio.async_sessionmaker
+    guild_cache: layer.GuildCache | None
+    bg_tasks: set[asyncio.Task]
 
     def __init__(self,
                  *args,
                  db_engine: sa_asyncio.AsyncEngine,
-                 confg: config.MiniConfig = config.MiniConfig(),
+                 confg: config.MiniConfig | None = None,
                  **kwargs) -> None:
         """Initializes the bot instance.
 
@@ -58,13 +66,19 @@ class TicketsPlusBot(commands.AutoShardedBot):
             *args: The arguments to pass to the superclass.
             db_engine: The database engine.
             confg: The config for the bot.
-                Defaults to `tickets_plus.statvars.MiniConfig`.
+                If None, a new `tickets_plus.database.config.MiniConfig` is created.
             **kwargs: The keyword arguments to pass to the superclass.
         """
         super().__init__(*args, **kwargs)
         self._db_engine = db_engine
-        self.stat_confg = confg
+        self.stat_confg = confg if confg is not None else config.MiniConfig()
         self.sessions = sa_asyncio.async_sessionmaker(self._db_engine, expire_on_commit=False)
+        cache_ttl = self.stat_confg.getitem("guild_cache_ttl", 60)
+        if cache_ttl > 0:
+            self.guild_cache = layer.GuildCache(cache_ttl, self.stat_confg.getitem("guild_cache_size", 1024))
+        else:
+            self.guild_cache = None
+        self.bg_tasks = set()
 
     async def setup_hook(self) -> None:
         """Runs just before the bot connects to Discord.
@@ -76,11 +90,15 @@ class TicketsPlusBot(commands.AutoShardedBot):
         logging.info("Bot version: %s", const.VERSION)
         logging.info("Discord.py version: %s", discord.__version__)
         logging.info("Loading cogs...")
-        for extension in cogs.EXTENSIONS:
-            try:
-                await self.load_extension(extension)
-            except commands.ExtensionError as err:
-                logging.error("Failed to load cog %s: %s", extension, err)
+        results = await asyncio.gather(
+            *(self.load_extension(extension) for extension in cogs.EXTENSIONS),
+            return_exceptions=True,
+        )
+        for extension, result in zip(cogs.EXTENSIONS, results):
+            if isinstance(result, commands.ExtensionError):
+                logging.error("Failed to load cog %s: %s", extension, result)
+            elif isinstance(result, BaseException):
+                raise result
         logging.info("Finished loading cogs.")
 
     def get_connection(self) -> layer.OnlineConfig:
@@ -95,14 +113,46 @@ class TicketsPlusBot(commands.AutoShardedBot):
             `tickets_plus.layer.OnlineConfig`: The OnlineConfig object.
                 A wrapper for the database connection.
         """
-        return layer.OnlineConfig(self, self.sessions())
+        return layer.OnlineConfig(self, self.sessions(), self.guild_cache)
+
+    def run_in_background(self, coro: Coroutine[Any, Any, None]) -> asyncio.Task:
+        """Runs a coroutine as a background task.
+
+        A reference to the task is kept until it is done,
+        so it can't be garbage collected mid-way.
+        Any exception it raises is logged.
+
+        Args:
+            coro: The coroutine to run.
+
+        Returns:
+            `asyncio.Task`: The task running the coroutine.
+        """
+        task = asyncio.create_task(coro)
+        self.bg_tasks.add(task)
+        task.add_done_callback(self._background_done)
+        return task
+
+    def _background_done(self, task: asyncio.Task) -> None:
+        """Forgets a finished background task and logs its failure.
+
+        Args:
+            task: The finished task.
+        """
+        self.bg_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logging.error("Background task failed.", exc_info=task.exception())
 
     async def close(self) -> None:
         """Closes the bot.
 
         This function is used to close the bot.
+        We let the background tasks finish first.
         We additionally clean up the database engine/pool.
         """
         logging.info("Closing bot...")
+        if self.bg_tasks:
+            logging.info("Waiting for %s background tasks...", len(self.bg_tasks))
+            await asyncio.gather(*self.bg_tasks, return_exceptions=True)
         await self._db_engine.dispose()
         return await super().close()
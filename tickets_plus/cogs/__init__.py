@@ -1,7 +1,7 @@
 """An import utility for loading all cogs in this submodule.
 
 This file just makes it easier to load all cogs in this submodule.
-We can just import this submodule and iterate over the `EXTENSIONS` list.
+We can just import this submodule and iterate over the `EXTENSIONS` tuple.
 
 Typical usage example:
     ```py
@@ -22,5 +22,5 @@ Typical usage example:
 
 import pkgutil
 
-EXTENSIONS = [module.name for module in pkgutil.iter_modules(__path__, f"{__package__}.")]
-"""A list of all cogs in this submodule. This is the list of cogs to load."""
+EXTENSIONS = tuple(module.name for module in pkgutil.iter_modules(__path__, f"{__package__}."))
+"""A tuple of all cogs in this submodule. These are the cogs to load."""
@@ -29,6 +29,9 @@ from sqlalchemy import exc
 from tickets_plus import bot
 from tickets_plus.ext import exceptions
 
+_PERM_SEP = "\n- "
+"""Separator for the missing permissions, renders as a markdown list."""
+
 
 class ErrorHandling(commands.Cog, name="AppCommandErrorHandler"):
     """Error handling for Tickets+.
@@ -84,14 +87,12 @@ class ErrorHandling(commands.Cog, name="AppCommandErrorHandler"):
             ctx: The interaction that raised the error.
             error: The error that was raised.
         """
-        if not ctx.response.is_done():
-            await ctx.response.defer(ephemeral=True)
-        if isinstance(ctx.command, app_commands.Command):
-            # Splitting because, we don't want AttributeError
-            if hasattr(ctx.command, "on_error"):
-                # Same as above
-                if ctx.command.on_error is not None:
-                    return
+        # Commands with their own error handler deal with it themselves.
+        # Context menus have no on_error, and ctx.command may be None.
+        if getattr(ctx.command, "on_error", None) is not None:
+            return
+        # Answer directly if we can, no need to defer first.
+        send = ctx.followup.send if ctx.response.is_done() else ctx.response.send_message
 
         emd = discord.Embed(
             title="Tickets+ Error: 500 - Internal Server Error",
@@ -108,7 +109,7 @@ class ErrorHandling(commands.Cog, name="AppCommandErrorHandler"):
             emd.title = "Tickets+ Error: 404 - Command Not Found"
             emd.description = "The command you tried to use does not exist."
             emd.set_footer(text="If this error persists, please report it.")
-            await ctx.followup.send(embed=emd, ephemeral=True)
+            await send(embed=emd, ephemeral=True)
             return
 
         if isinstance(error, app_commands.CheckFailure):
@@ -118,17 +119,17 @@ class ErrorHandling(commands.Cog, name="AppCommandErrorHandler"):
                                    " to run this command.\n"
                                    "Please ask a server administrator to grant the bot the "
                                    "following permissions:\n"
-                                   f"{chr(92).join(error.missing_permissions)}")
+                                   f"- {_PERM_SEP.join(error.missing_permissions)}")
                 emd.set_footer(text="If you are sure the bot has the "
                                "required permissions, please report this.")
-                await ctx.followup.send(embed=emd, ephemeral=True)
+                await send(embed=emd, ephemeral=True)
                 return
 
             if isinstance(error, app_commands.NoPrivateMessage):
                 emd.title = "Tickets+ Error: 405 - DMs Not Allowed"
                 emd.description = "This command cannot be used in DMs."
                 emd.set_footer(text="Please use this command in a server.")
-                await ctx.followup.send(embed=emd, ephemeral=True)
+                await send(embed=emd, ephemeral=True)
                 return
 
             if isinstance(error, app_commands.CommandOnCooldown):
@@ -136,20 +137,20 @@ class ErrorHandling(commands.Cog, name="AppCommandErrorHandler"):
                 emd.description = ("This command is on cooldown.\n"
                                    f"Please try again in {error.retry_after} seconds.")
                 emd.set_footer(text="Thank you for using Tickets+!")
-                await ctx.followup.send(embed=emd, ephemeral=True)
+                await send(embed=emd, ephemeral=True)
                 return
 
             emd.title = "Tickets+ Error: 403 - Forbidden"
             emd.description = "You do not have permission to use this command."
             emd.set_footer(text=f"Error type: {type(error).__name__}")
-            await ctx.followup.send(embed=emd, ephemeral=True)
+            await send(embed=emd, ephemeral=True)
             return
 
         if isinstance(error, exceptions.TicketsPlusCommandError):
             emd.title = "Tickets+ Error: 400 - Bad Request"
             emd.description = str(error)
             emd.set_footer(text=f"Error type: {type(error).__name__}")
-            await ctx.followup.send(embed=emd, ephemeral=True)
+            await send(embed=emd, ephemeral=True)
             return  # We don't want to log this error.
 
         if isinstance(error, app_commands.CommandInvokeError):
@@ -163,13 +164,13 @@ class ErrorHandling(commands.Cog, name="AppCommandErrorHandler"):
                                    "please report it.\n"
                                    "You can get the link to GitHub and support server by "
                                    "using the /version command.")
-                emd.set_footer(text=f"Error type: {type(underlying_error)}")
-                await ctx.followup.send(embed=emd, ephemeral=True)
+                emd.set_footer(text=f"Error type: {type(underlying_error).__name__}")
+                await send(embed=emd, ephemeral=True)
                 return
 
         logging.error("An unhandled error occurred while executing a command:", exc_info=error)
         emd.set_footer(text=f"Error type: {type(error).__name__}")
-        await ctx.followup.send(embed=emd, ephemeral=True)
+        await send(embed=emd, ephemeral=True)
 
 
 async def setup(bot_instance: bot.TicketsPlusBot) -> None:
@@ -35,6 +35,70 @@ from tickets_plus import bot
 from tickets_plus.database import layer, models
 from tickets_plus.ext import legacy
 
+_LINK_MARKER = "discord.com/channels/"
+"""The constant part of a Discord message link. Used for message discovery."""
+_LINK_PREFIXES = ("https://", "https://canary.", "https://ptb.")
+"""Accepted prefixes directly preceding `_LINK_MARKER`."""
+_HELPING_BLOCK_OVERWRITE = discord.PermissionOverwrite(
+    view_channel=False,
+    add_reactions=False,
+    send_messages=False,
+    read_messages=False,
+    read_message_history=False,
+)
+"""Permission overwrite for the helping block role in new tickets."""
+_COMMUNITY_OVERWRITE = discord.PermissionOverwrite(
+    view_channel=True,
+    add_reactions=True,
+    send_messages=True,
+    read_messages=True,
+    read_message_history=True,
+    attach_files=True,
+    embed_links=True,
+    use_application_commands=True,
+)
+"""Permission overwrite for community support roles in new tickets."""
+
+
+def _is_snowflake(text: str) -> bool:
+    """Checks if a string is a plausible Discord snowflake.
+
+    Args:
+        text: The string to check.
+
+    Returns:
+        bool: Whether the string is 17 to 20 ASCII digits.
+    """
+    return 17 <= len(text) <= 20 and text.isascii() and text.isdecimal()
+
+
+def _parse_message_link(content: str) -> Tuple[int, int, int] | None:
+    """Finds the first Discord message link in a string.
+
+    A hand-written parser, as a regex is much slower for this fixed shape.
+    Matches https links to discord.com, including canary and ptb.
+
+    Args:
+        content: The string to search.
+
+    Returns:
+        Tuple[int, int, int] | None: The guild, channel and message IDs.
+            None if no valid message link was found.
+    """
+    idx = content.find(_LINK_MARKER)
+    while idx != -1:
+        start = idx + len(_LINK_MARKER)
+        if content.endswith(_LINK_PREFIXES, 0, idx):
+            srv, _, rest = content[start:start + 64].partition("/")
+            cha, _, rest = rest.partition("/")
+            # The message ID may be followed by anything, e.g. ">" or ")".
+            head = rest[:21]
+            msg_len = len(head) - len(head.lstrip("0123456789"))
+            if _is_snowflake(srv) and _is_snowflake(cha) and 17 <= msg_len <= 20:
+                return int(srv), int(cha), int(head[:msg_len])
+        idx = content.find(_LINK_MARKER, start)
+    return None
+
 
 class Events(commands.Cog, name="Events"):
     """Event handling for Tickets+.
@@ -52,6 +116,7 @@ class Events(commands.Cog, name="Events"):
             bot_instance: The bot instance.
         """
         self._bt = bot_instance
+        self._mc_intent = bot_instance.intents.message_content
         logging.info("Loaded %s", self.__class__.__name__)
 
     async def ticket_creation(
@@ -64,6 +129,8 @@ class Events(commands.Cog, name="Events"):
         """Main ticket creation function.
 
         Creates db and does some other stuff.
+        The guild config must have its ticket bots, observer roles,
+        community roles and community pings loaded.
         """
         gld, guild = guilded
         ttypes = await confg.get_ticket_types(gld.id)
@@ -75,51 +142,31 @@ class Events(commands.Cog, name="Events"):
             return
         nts_thrd = None
         if guild.legacy_threads:
-            nts_thrd = await legacy.thread_create(channel, guild, confg)
+            nts_thrd = await legacy.thread_create(channel, guild)
         user_id = user.id if user else None
         thr_id = nts_thrd.id if nts_thrd else None
         await confg.get_ticket(channel.id, gld.id, user_id, thr_id)
+        overwrites = dict(channel.overwrites)
         if guild.helping_block:
-            overwrite = discord.PermissionOverwrite(
-                view_channel=False,
-                add_reactions=False,
-                send_messages=False,
-                read_messages=False,
-                read_message_history=False,
-            )
             rol = gld.get_role(guild.helping_block)
             if rol is None:
                 guild.helping_block = None
             else:
-                await channel.set_permissions(
-                    rol,
-                    overwrite=overwrite,
-                    reason="Penalty Enforcement",
-                )
+                overwrites[rol] = _HELPING_BLOCK_OVERWRITE
         if guild.community_roles and ticket_type.comaccs:
-            comm_roles = await confg.get_all_community_roles(gld.id)
-            overwrite = discord.PermissionOverwrite(
-                view_channel=True,
-                add_reactions=True,
-                send_messages=True,
-                read_messages=True,
-                read_message_history=True,
-                attach_files=True,
-                embed_links=True,
-                use_application_commands=True,
-            )
-            for role in comm_roles:
+            for role in guild.community_roles:
                 rle = gld.get_role(role.role_id)
                 if rle is None:
                     continue
-                await channel.set_permissions(
-                    rle,
-                    overwrite=overwrite,
-                    reason="Community Support Access",
-                )
+                overwrites[rle] = _COMMUNITY_OVERWRITE
+        if overwrites != channel.overwrites:
+            # One request for all overwrites instead of one per role.
+            await channel.edit(
+                overwrites=overwrites,
+                reason="Penalty Enforcement and Community Support Access",
+            )
         if guild.community_pings and ticket_type.comping:
-            comm_pings = await confg.get_all_community_pings(gld.id)
-            inv = await channel.send(" ".join([f"<@&{role.role_id}>" for role in comm_pings]))
+            inv = await channel.send(" ".join(f"<@&{role.role_id}>" for role in guild.community_pings))
             await asyncio.sleep(0.25)
             await inv.delete()
         descr = (f"Ticket {channel.name}\n"
@@ -134,11 +181,13 @@ class Events(commands.Cog, name="Events"):
             descr += "\nIf no one responds, the ticket will be closed automatically. Thank you for your patience!"
         await channel.edit(topic=descr, reason="More information for the ticket.")
         if guild.strip_buttons and ticket_type.strpbuttns:
+            ticket_bot_ids = frozenset(tbot.user_id for tbot in guild.ticket_bots)
             await asyncio.sleep(5)
-            async for msg in channel.history(oldest_first=True, limit=2):
-                if await confg.check_ticket_bot(msg.author.id, gld.id):
-                    await channel.send(embeds=msg.embeds)
-                    await msg.delete()
+            msgs = [msg async for msg in channel.history(oldest_first=True, limit=2)]
+            for msg in msgs:
+                if msg.author.id in ticket_bot_ids:
+                    # Resend and delete at once, messages stay in order.
+                    await asyncio.gather(channel.send(embeds=msg.embeds), msg.delete())
         await confg.commit()
 
     async def message_discovery(self, message: discord.Message) -> None:
@@ -150,43 +199,41 @@ class Events(commands.Cog, name="Events"):
         Args:
             message: The message to check for links
         """
-        alpha = re.search(
-            # skipcq: FLK-E501 # pylint: disable=line-too-long
-            r"https://(?:canary\.)?discord\.com/channels/(?P<srv>\d*)/(?P<cha>\d*)/(?P<msg>\d*)",
-            message.content,
-        )
-        if alpha:
-            # We do not check any types in try as we are catching.
-            try:
-                gld = self._bt.get_guild(int(alpha.group("srv")))
-                chan: abc.GuildChannel = (
-                    gld.get_channel_or_thread(  # type: ignore
-                        int(alpha.group("cha"))))
-                got_msg = await chan.fetch_message(  # type: ignore
-                    int(alpha.group("msg")))
-            except (
-                    AttributeError,
-                    discord.HTTPException,
-            ):
-                logging.warning("Message discovery failed.")
-            else:
-                time = got_msg.created_at.strftime("%d/%m/%Y %H:%M:%S")
-                if not got_msg.content and got_msg.embeds:
-                    discovered_result = got_msg.embeds[0]
-                    discovered_result.set_footer(text="[EMBED CAPTURED] Sent in"
-                                                 f" {chan.name}"
-                                                 f" at {time}")
-                else:
-                    discovered_result = discord.Embed(description=got_msg.content, color=0x0D0EB4)
-                    discovered_result.set_footer(text="Sent in "
-                                                 f"{chan.name} at {time}"  # type: ignore
-                                                )
-                discovered_result.set_author(
-                    name=got_msg.author.name,
-                    icon_url=got_msg.author.display_avatar.url,
-                )
-                discovered_result.set_image(url=got_msg.attachments[0].url if got_msg.attachments else None)
-                await message.reply(embed=discovered_result)
+        content = message.content
+        if _LINK_MARKER not in content:
+            # Cheap substring check, most messages carry no link.
+            return
+        link = _parse_message_link(content)
+        if link is None:
+            return
+        srv, cha, msg_id = link
+        gld = self._bt.get_guild(srv)
+        if gld is None:
+            # Not a guild we are in, nothing to fetch.
+            return
+        chan = gld.get_channel_or_thread(cha)
+        if not isinstance(chan, abc.Messageable):
+            # Missing channel or one without messages, e.g. a category.
+            return
+        try:
+            got_msg = await chan.fetch_message(msg_id)
+        except discord.HTTPException:
+            logging.warning("Message discovery failed.")
+            return
+        time = got_msg.created_at.strftime("%d/%m/%Y %H:%M:%S")
+        if not got_msg.content and got_msg.embeds:
+            data: Any = got_msg.embeds[0].to_dict()
+            footer = f"[EMBED CAPTURED] Sent in {chan.name} at {time}"  # type: ignore
+        else:
+            data = {"description": got_msg.content, "color": 0x0D0EB4}
+            footer = f"Sent in {chan.name} at {time}"  # type: ignore
+        data["footer"] = {"text": footer}
+        data["author"] = {"name": got_msg.author.name, "icon_url": got_msg.author.display_avatar.url}
+        if got_msg.attachments:
+            data["image"] = {"url": got_msg.attachments[0].url}
+        else:
+            data.pop("image", None)
+        await message.reply(embed=discord.Embed.from_dict(data))
 
     async def handle_anon(self, message: discord.Message, ticket: models.Ticket, cnfg: layer.OnlineConfig,
                           guild: models.Guild) -> None:
@@ -203,16 +250,10 @@ class Events(commands.Cog, name="Events"):
         if ticket.anonymous:
             if ticket.user_id == message.author.id:
                 return
-            staff = False
             staff_roles = await cnfg.get_all_staff_roles(guild.guild_id)
-            for role in staff_roles:
-                parsed_role = message.guild.get_role(  # type: ignore
-                    role.role_id)
-                if parsed_role in message.author.roles:  # type: ignore
-                    # Already checked for member
-                    staff = True
-                    break
-            if not staff:
+            staff_ids = frozenset(role.role_id for role in staff_roles)
+            # Already checked for member
+            if not any(role.id in staff_ids for role in message.author.roles):  # type: ignore
                 return
             await message.channel.send(
                 f"**{guild.staff_team_name}:** "
@@ -235,7 +276,7 @@ class Events(commands.Cog, name="Events"):
         """
         chan = message.channel
         if guild.any_autoclose:
-            time_since_update = datetime.datetime.utcnow() - ticket.last_response
+            time_since_update = datetime.datetime.now(datetime.UTC).replace(tzinfo=None) - ticket.last_response
             if time_since_update >= datetime.timedelta(minutes=5):
                 crrnt = chan.topic  # type: ignore
                 if crrnt is None:
@@ -252,7 +293,7 @@ class Events(commands.Cog, name="Events"):
                         f"<t:{int((message.created_at + guild.any_autoclose).timestamp())}:R>",
                         crrnt)
                 await chan.edit(topic=crrnt)  # type: ignore
-                ticket.last_response = datetime.datetime.utcnow()
+                ticket.last_response = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
                 await cnfg.commit()
 
     @commands.Cog.listener(name="on_guild_channel_create")
@@ -265,24 +306,32 @@ class Events(commands.Cog, name="Events"):
         Args:
             channel: The channel that was created.
         """
+        if not isinstance(channel, discord.channel.TextChannel):
+            return
         async with self._bt.get_connection() as confg:
-            if isinstance(channel, discord.channel.TextChannel):
-                gld = channel.guild
-                guild = await confg.get_guild(
-                    gld.id,
-                    (
-                        orm.selectinload(models.Guild.observers_roles),
-                        orm.selectinload(models.Guild.community_roles),
-                        orm.selectinload(models.Guild.community_pings),
-                    ),
-                )
-                if guild.integrated:
-                    return
-                async for entry in gld.audit_logs(limit=3, action=discord.AuditLogAction.channel_create):
-                    if not entry.user:
-                        continue
-                    if entry.target == channel and await confg.check_ticket_bot(entry.user.id, gld.id):
-                        await self.ticket_creation(confg, (gld, guild), channel)
+            gld = channel.guild
+            guild = await confg.get_guild(
+                gld.id,
+                (
+                    orm.selectinload(models.Guild.observers_roles),
+                    orm.selectinload(models.Guild.community_roles),
+                    orm.selectinload(models.Guild.community_pings),
+                    orm.selectinload(models.Guild.ticket_bots),
+                ),
+            )
+            if guild.integrated:
+                return
+            ticket_bot_ids = frozenset(tbot.user_id for tbot in guild.ticket_bots)
+            if not ticket_bot_ids:
+                # No ticket bots configured, skip the audit log request.
+                return
+            async for entry in gld.audit_logs(limit=3, action=discord.AuditLogAction.channel_create):
+                if entry.target != channel:
+                    # Channels may be created in quick succession.
+                    continue
+                if entry.user and entry.user.id in ticket_bot_ids:
+                    await self.ticket_creation(confg, (gld, guild), channel)
+                break
 
     @commands.Cog.listener(name="on_guild_channel_delete")
     async def on_channel_delete(self, channel: discord.abc.GuildChannel) -> None:
@@ -317,8 +366,9 @@ class Events(commands.Cog, name="Events"):
             if actv_member.status:
                 if actv_member.status_till is not None:
                     # Split this up to avoid None comparison.
-                    # pylint: disable=line-too-long
-                    if actv_member.status_till <= datetime.datetime.utcnow():  # type: ignore
+                    # Stored times are naive UTC.
+                    now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+                    if actv_member.status_till <= now:  # type: ignore
                         # Check if the penalty has expired.
                         actv_member.status = 0
                         actv_member.status_till = None
@@ -360,11 +410,11 @@ class Events(commands.Cog, name="Events"):
         Args:
             message: The message that was sent.
         """
+        if message.author.bot or message.guild is None:
+            return
         async with self._bt.get_connection() as cnfg:
-            if message.author.bot or message.guild is None:
-                return
             guild = await cnfg.get_guild(message.guild.id)
-            if guild.msg_discovery:
+            if self._mc_intent and guild.msg_discovery:
                 await self.message_discovery(message)
             ticket = await cnfg.fetch_ticket(message.channel.id)
             if ticket:
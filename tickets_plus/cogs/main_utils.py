@@ -28,6 +28,18 @@ from discord.ext import commands
 from tickets_plus import bot
 from tickets_plus.database import const
 
+_VERSION_EMBED = discord.Embed(
+    title="Tickets+",
+    description=f"Bot version: {const.VERSION}\n"
+    "This bot is open source and experimental!",
+    color=discord.Color.from_str("0x00FFFF"),
+).add_field(
+    name="Source Code:",
+    value=("[Available on GitHub](https://github.com/Tech-TTGames/Tickets-Plus)"
+           "\nThis is the place to report bugs and suggest features."),
+)  # .add_field(name="Get Support:", value="[Join the support server](<NO SUPPORT SERVER YET>)")
+"""The static embed sent by the version command. Built once at import."""
+
 
 class FreeCommands(commands.Cog, name="General Random Commands"):
     """General commands that don't fit anywhere else.
@@ -59,8 +71,7 @@ class FreeCommands(commands.Cog, name="General Random Commands"):
             ctx: The interaction context.
         """
         embd = discord.Embed(title="Pong!",
-                             description=f"The bot is online.\nPing: "
-                             f"{str(round(self._bt.latency * 1000))}ms",
+                             description=f"The bot is online.\nPing: {round(self._bt.latency * 1000)}ms",
                              color=discord.Color.green())
         await ctx.response.send_message(embed=embd)
 
@@ -73,19 +84,7 @@ class FreeCommands(commands.Cog, name="General Random Commands"):
         Args:
             ctx: The interaction context.
         """
-        emd = discord.Embed(
-            title="Tickets+",
-            description=f"Bot version: {const.VERSION}\n"
-            "This bot is open source and experimental!",
-            color=discord.Color.from_str("0x00FFFF"),
-        ).add_field(
-            name="Source Code:",
-            value=("[Available on GitHub](https://github.com/Tech-TTGames/Tickets-Plus)"
-                   "\nThis is the place to report bugs and suggest features."),
-        )
-        # .add_field(name="Get Support:",
-        #            value="[Join the support server](<NO SUPPORT SERVER YET>)")
-        await ctx.response.send_message(embed=emd)
+        await ctx.response.send_message(embed=_VERSION_EMBED)
 
     @app_commands.command(name="invite", description="Invite the bot to a server.")
     async def invite(self, ctx: discord.Interaction) -> None:
@@ -34,7 +34,15 @@ from tickets_plus.database import config, const
 from tickets_plus.ext import checks, views
 
 _CNFG = config.MiniConfig()
-"""Submodule private global constant for the config."""
+"""Submodule private global constant for the config.
+
+Only needed at class definition time for the dev guild decorator.
+At runtime the bot's own config is used instead.
+"""
+_PULL_TIMEOUT = 30
+"""Seconds to wait for `git pull` before stopping it."""
+_LOG_DIR = os.path.join(const.PROG_DIR, "log")
+"""The directory holding the bot's log files."""
 
 
 @app_commands.guilds(_CNFG.getitem("dev_guild_id"))
@@ -67,9 +75,9 @@ class Overrides(commands.GroupCog, name="override", description="Owner override
     async def reload(self, ctx: discord.Interaction, sync: bool = False) -> None:
         """Reloads the bot's cogs.
 
-        This command reloads all cogs in the EXTENSIONS list.
+        This command reloads all cogs in the EXTENSIONS tuple.
         Reloads are atomic, so if one fails, it rolls back.
-        We can just import this submodule and iterate over the EXTENSIONS list.
+        We can just import this submodule and iterate over the EXTENSIONS tuple.
         You can also sync the tree after reloading cogs. Though this is not
         to be used very often, as it has low rate limits.
 
@@ -79,13 +87,19 @@ class Overrides(commands.GroupCog, name="override", description="Owner override
         """
         await ctx.response.send_message("Reloading cogs...")
         logging.info("Reloading cogs...")
-        for extension in cogs.EXTENSIONS:
-            await self._bt.reload_extension(extension)
+        results = await asyncio.gather(
+            *(self._bt.reload_extension(extension) for extension in cogs.EXTENSIONS),
+            return_exceptions=True,
+        )
+        for extension, result in zip(cogs.EXTENSIONS, results):
+            if isinstance(result, Exception):
+                # Retry failures one by one, so the error surfaces as usual.
+                await self._bt.reload_extension(extension)
         await ctx.followup.send("Reloaded cogs.")
         logging.info("Finished reloading cogs.")
         if sync:
             await self._bt.tree.sync()
-            dev_guild = self._bt.get_guild(_CNFG.getitem("dev_guild_id"))
+            dev_guild = self._bt.get_guild(self._bt.stat_confg.getitem("dev_guild_id"))
             await self._bt.tree.sync(guild=dev_guild)
             logging.info("Finished syncing tree.")
 
@@ -147,24 +161,67 @@ class Overrides(commands.GroupCog, name="override", description="Owner override
         await ctx.followup.edit_message(mgs.id, embed=emd)
         await ctx.followup.send("Pulling latest changes...")
         logging.info("Pulling latest changes...")
-        pull = await asyncio.create_subprocess_shell(
-            "git pull",
+        pull = await asyncio.create_subprocess_exec(
+            "git",
+            "pull",
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.PIPE,
             cwd=const.PROG_DIR,
         )
-        stdo, stdr = await pull.communicate()
-        if stdo:
-            await ctx.followup.send(f"[stdout]\n{stdo.decode()}")
-            logging.info("[stdout]\n%s", stdo.decode())
-
-        if stdr:
-            await ctx.followup.send(f"[stderr]\n{stdr.decode()}")
-            logging.info("[stderr]\n%s", stdr.decode())
+        timed_out = False
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    self._relay(ctx, pull.stdout, "stdout"),  # type: ignore
+                    self._relay(ctx, pull.stderr, "stderr"),  # type: ignore
+                    pull.wait(),
+                ),
+                timeout=_PULL_TIMEOUT,
+            )
+        except TimeoutError:
+            timed_out = True
+            if pull.returncode is None:
+                # Give git a chance to clean up its lock files
+                pull.terminate()
+                try:
+                    await asyncio.wait_for(pull.wait(), timeout=5)
+                except TimeoutError:
+                    pass
+        finally:
+            # Also reached if relaying the output failed
+            if pull.returncode is None:
+                pull.kill()
+            await pull.wait()
+        if timed_out:
+            await ctx.followup.send("Pulling timed out. The git process was stopped.")
+            logging.warning("git pull timed out after %s seconds.", _PULL_TIMEOUT)
+            return
 
         await ctx.followup.send("Finished pulling latest changes.\n"
                                 "Restart bot or reload cogs to apply changes.")
 
+    @staticmethod
+    async def _relay(ctx: discord.Interaction, stream: asyncio.StreamReader, label: str) -> None:
+        """Relays a subprocess stream to the user as it is produced.
+
+        Lines are batched into messages below the Discord length limit.
+
+        Args:
+            ctx: The interaction context.
+            stream: The subprocess stream to read.
+            label: The stream name, used as a message header.
+        """
+        chunk = ""
+        async for raw_line in stream:
+            line = raw_line.decode(errors="replace")[:1800]
+            logging.info("[%s] %s", label, line.rstrip())
+            if len(chunk) + len(line) > 1800:
+                await ctx.followup.send(f"[{label}]\n{chunk}")
+                chunk = ""
+            chunk += line
+        if chunk:
+            await ctx.followup.send(f"[{label}]\n{chunk}")
+
     @app_commands.command(name="logs", description="Sends the logs.")
     @checks.is_owner_check()
     @app_commands.describe(id_no="Log ID (0 for latest log)")
@@ -183,13 +240,15 @@ class Overrides(commands.GroupCog, name="override", description="Owner override
         await ctx.response.defer(thinking=True)
         logging.info("Sending logs to %s...", str(ctx.user))
         filename = f"bot.log{"."+str(id_no) if id_no else ""}"
-        file_path = os.path.join(const.PROG_DIR, "log", filename)
+        file_path = os.path.join(_LOG_DIR, filename)
         try:
-            await ctx.user.send(file=discord.File(fp=file_path))
+            log_f = await asyncio.to_thread(open, file_path, "rb")
         except FileNotFoundError:
             await ctx.followup.send("Specified log not found.")
             logging.info("Specified log not found.")
             return
+        with log_f:
+            await ctx.user.send(file=discord.File(fp=log_f, filename=filename))
         await ctx.followup.send("Sent logs.")
         logging.info("Logs sent.")
 
@@ -242,7 +301,7 @@ class Overrides(commands.GroupCog, name="override", description="Owner override
         await ctx.send("Syncing...")
         logging.info("Syncing...")
         await self._bt.tree.sync()
-        dev_guild = self._bt.get_guild(_CNFG.getitem("dev_guild_id"))
+        dev_guild = self._bt.get_guild(self._bt.stat_confg.getitem("dev_guild_id"))
         await self._bt.tree.sync(guild=dev_guild)
         await ctx.send("Synced.")
         logging.info("Synced.")
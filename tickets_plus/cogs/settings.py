@@ -27,8 +27,12 @@ from discord import app_commands
 from discord.ext import commands
 
 from tickets_plus import bot
+from tickets_plus.database import models
 from tickets_plus.ext import exceptions
 
+_TOGGLE_FLAGS = ("msg_discovery", "strip_buttons", "strip_roles", "integrated")
+"""Guild flags toggled by `/settings toggle`, indexed by choice value."""
+
 
 @app_commands.guild_only()
 @app_commands.default_permissions(administrator=True)
@@ -115,14 +119,14 @@ class Settings(commands.GroupCog, name="settings", description="Settings for the
         """
         await ctx.response.defer(ephemeral=True)
         async with self._bt.get_connection() as conn:
-            new, staff_role = await conn.get_staff_role(
+            new = await conn.toggle_role(
+                models.StaffRole,
                 role.id,
                 ctx.guild_id,  # type: ignore
             )
             color = discord.Color.green() if new else discord.Color.red()
             emd = discord.Embed(title="Staff Role List Edited", color=color)
             if not new:
-                await conn.delete(staff_role)
                 emd.add_field(name="Removed:", value=role.mention)
             else:
                 emd.add_field(name="Added:", value=role.mention)
@@ -145,7 +149,8 @@ class Settings(commands.GroupCog, name="settings", description="Settings for the
         """
         await ctx.response.defer(ephemeral=True)
         async with self._bt.get_connection() as conn:
-            new, obsrvrs = await conn.get_observers_role(
+            new = await conn.toggle_role(
+                models.ObserversRole,
                 role.id,
                 ctx.guild_id,  # type: ignore
             )
@@ -153,7 +158,6 @@ class Settings(commands.GroupCog, name="settings", description="Settings for the
             emd = discord.Embed(title="Observers Role List Edited", color=color)
             emd.set_footer(text="Warning! Ticket notes are currently legacy, please use the main bot for ticket notes.")
             if not new:
-                await conn.delete(obsrvrs)
                 emd.add_field(name="Removed:", value=role.mention)
             else:
                 emd.add_field(name="Added:", value=role.mention)
@@ -176,14 +180,14 @@ class Settings(commands.GroupCog, name="settings", description="Settings for the
         """
         await ctx.response.defer(ephemeral=True)
         async with self._bt.get_connection() as conn:
-            new, comsup = await conn.get_community_role(
+            new = await conn.toggle_role(
+                models.CommunityRole,
                 role.id,
                 ctx.guild_id,  # type: ignore
             )
             color = discord.Color.green() if new else discord.Color.red()
             emd = discord.Embed(title="Community Support Role List Edited", color=color)
             if not new:
-                await conn.delete(comsup)
                 emd.add_field(name="Removed:", value=role.mention)
             else:
                 emd.add_field(name="Added:", value=role.mention)
@@ -208,14 +212,14 @@ class Settings(commands.GroupCog, name="settings", description="Settings for the
         """
         await ctx.response.defer(ephemeral=True)
         async with self._bt.get_connection() as conn:
-            new, comsup = await conn.get_community_ping(
+            new = await conn.toggle_role(
+                models.CommunityPing,
                 role.id,
                 ctx.guild_id,  # type: ignore
             )
             color = discord.Color.green() if new else discord.Color.red()
             emd = discord.Embed(title="Community Ping Role List Edited", color=color)
             if not new:
-                await conn.delete(comsup)
                 emd.add_field(name="Removed:", value=role.mention)
             else:
                 emd.add_field(name="Added:", value=role.mention)
@@ -409,19 +413,9 @@ class Settings(commands.GroupCog, name="settings", description="Settings for the
         """
         await ctx.response.defer(ephemeral=True)
         async with self._bt.get_connection() as conn:
-            guild = await conn.get_guild(ctx.guild_id)  # type: ignore
-            if value.value == 0:
-                new_status = not guild.msg_discovery
-                guild.msg_discovery = new_status
-            elif value.value == 1:
-                new_status = not guild.strip_buttons
-                guild.strip_buttons = new_status
-            elif value.value == 2:
-                new_status = not guild.strip_roles
-                guild.strip_roles = new_status
-            else:
-                new_status = not guild.integrated
-                guild.integrated = new_status
+            new_status = await conn.toggle_guild_flag(
+                ctx.guild_id,  # type: ignore
+                _TOGGLE_FLAGS[value.value])
             await conn.commit()
         emd = discord.Embed(title="Value Toggled",
                             description=f"{value.name} is now {new_status}",
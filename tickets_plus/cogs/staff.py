@@ -96,8 +96,6 @@ class StaffCmmd(commands.Cog, name="StaffCommands"):
                 )
                 await ctx.channel.send(f"**{guild.staff_team_name}:** {message}")
 
-            await confg.close()
-
     @app_commands.command(name="join", description="Join a ticket's staff notes.")
     @app_commands.guild_only()
     @checks.is_staff_check()
@@ -4,9 +4,10 @@ This module contains the `OnlineConfig` class.
 It is used to make the database session easier to use.
 It is also an async context manager.
 Generally, you should use this class instead of the session directly.
-Additionally, of note is the fact that one-on-one relationships are loaded
-by default. But any relationship that is a one-to-many or many-to-many
-relationship is not loaded by default.
+Additionally, of note is the fact that only the guild and user relationships
+of members and tickets are loaded by default. The guild relationship of roles,
+ticket bots, ticket types and tags is not loaded, neither is any relationship
+that is a one-to-many or many-to-many relationship.
 This is due to efficiency concerns.
 If you need to load a relationship, you can use the options argument, which
 is a list of `sqlalchemy.sql.base.ExecutableOption`s.
@@ -30,18 +31,113 @@ Typical usage example:
 # If later approved by the Initial Contributor, GPL-3.0-or-later.
 
 import datetime
+import itertools
+import time
 import types
 from typing import Any, Sequence, Tuple, Type
 
 import discord
+import sqlalchemy
 from discord import utils
 from discord.ext import commands
-from sqlalchemy import sql
+from sqlalchemy import event, orm, sql
 from sqlalchemy.ext import asyncio as sa_asyncio
 from sqlalchemy.sql import base
 
 from tickets_plus.database import models
 
+_GUILD_MAPPER = orm.class_mapper(models.Guild)
+"""The mapper of the guild table. Used to build guild identity keys."""
+_GUILD_COLUMNS = tuple(attr.key for attr in _GUILD_MAPPER.column_attrs)
+"""The attribute names of all guild table columns."""
+_PENDING_TICKETS = sql.select(models.Ticket).join(models.Guild).filter(
+    models.Guild.warn_autoclose.isnot(None), models.Ticket.notified.isnot(True),
+    models.Ticket.last_response <= models.UTCnow() - models.Guild.warn_autoclose)
+"""Tickets due an autoclose warning. It has no parameters, so it is built once."""
+
+
+class GuildCache:
+    """A process-wide cache of guild configuration rows.
+
+    Holds plain column snapshots, never ORM instances.
+    So no session state is ever shared between connections.
+    Entries are dropped whenever a session that changed the guild commits.
+    This assumes a single bot process owns the database.
+    Changes made outside it, by scripts or a second instance, are only
+    noticed once the entry expires.
+    """
+
+    def __init__(self, ttl: float = 60, max_size: int = 1024) -> None:
+        """Initialises an empty cache.
+
+        Args:
+            ttl: The number of seconds an entry is served for.
+            max_size: The number of guilds kept at most.
+                The oldest entry is dropped to make room for a new one.
+        """
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries: dict[int, tuple[float, dict[str, Any]]] = {}
+        self._epochs: dict[int, int] = {}
+
+    def epoch(self, guild_id: int) -> int:
+        """The invalidation counter of a guild.
+
+        Take it before querying a guild and pass it to `put`.
+        This keeps a load racing an invalidation from caching stale data.
+
+        Args:
+            guild_id: The guild ID.
+
+        Returns:
+            int: The current invalidation counter of the guild.
+        """
+        return self._epochs.get(guild_id, 0)
+
+    def get(self, guild_id: int) -> dict[str, Any] | None:
+        """Get the cached columns of a guild.
+
+        Args:
+            guild_id: The guild ID.
+
+        Returns:
+            dict[str, Any] | None: The column values.
+                None if not cached or if the entry expired.
+        """
+        entry = self._entries.get(guild_id)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            del self._entries[guild_id]
+            return None
+        return entry[1]
+
+    def put(self, guild: models.Guild, epoch: int) -> None:
+        """Cache the columns of a freshly loaded guild.
+
+        Args:
+            guild: The guild, as loaded from the database.
+            epoch: The `epoch` of the guild taken before it was queried.
+                If the guild was invalidated since, nothing is cached.
+        """
+        if epoch != self._epochs.get(guild.guild_id, 0):
+            return
+        self._entries.pop(guild.guild_id, None)
+        if len(self._entries) >= self._max_size:
+            # Dicts keep insertion order, so this is the oldest entry.
+            del self._entries[next(iter(self._entries))]
+        snapshot = {key: getattr(guild, key) for key in _GUILD_COLUMNS}
+        self._entries[guild.guild_id] = (time.monotonic() + self._ttl, snapshot)
+
+    def invalidate(self, guild_id: int) -> None:
+        """Drop a guild from the cache.
+
+        Args:
+            guild_id: The guild ID.
+        """
+        self._epochs[guild_id] = self._epochs.get(guild_id, 0) + 1
+        self._entries.pop(guild_id, None)
+
 
 class OnlineConfig:
     """A convenience layer for the database session.
@@ -51,7 +147,10 @@ class OnlineConfig:
     Any and all commits have to be done manually.
     """
 
-    def __init__(self, bot_instance: commands.AutoShardedBot, session: sa_asyncio.AsyncSession) -> None:
+    def __init__(self,
+                 bot_instance: commands.AutoShardedBot,
+                 session: sa_asyncio.AsyncSession,
+                 guild_cache: GuildCache | None = None) -> None:
         """Initialises the database session layer.
 
         Wraps the provided session in an async context manager.
@@ -60,9 +159,35 @@ class OnlineConfig:
         Args:
             bot_instance: The bot instance.
             session: The database session.
+            guild_cache: The shared guild cache, if any.
+                If None, guilds are always loaded from the database.
         """
         self._session = session
         self._bot = bot_instance
+        self._guild_cache = guild_cache
+        self._guild_ids: set[int] = set()
+        self._changed_guild_ids: set[int] = set()
+        if guild_cache is not None:
+            event.listen(session.sync_session, "before_flush", self._track_changed_guilds)
+
+    def _track_changed_guilds(self, session: orm.Session, flush_context: Any, instances: Any) -> None:
+        """Remember the guilds a flush is about to write.
+
+        Called by SQLAlchemy before every flush, including the one in commit.
+        Guilds that were only read are not recorded.
+
+        Args:
+            session: The synchronous session being flushed.
+            flush_context: Unused, part of the event signature.
+            instances: Unused, part of the event signature.
+        """
+        _ = flush_context, instances
+        for obj in itertools.chain(session.new, session.deleted):
+            if isinstance(obj, models.Guild):
+                self._changed_guild_ids.add(obj.guild_id)
+        for obj in session.dirty:
+            if isinstance(obj, models.Guild) and session.is_modified(obj):
+                self._changed_guild_ids.add(obj.guild_id)
 
     async def __aenter__(self) -> "OnlineConfig":
         """Enter the 'async with' statement.
@@ -81,22 +206,28 @@ class OnlineConfig:
         This method is called when exiting the 'async with' statement.
         Or when an exception is raised.
         We roll back the session if an exception is raised.
-        We then close the session regardless.
+        We then close the session regardless, even if the rollback fails
+        or the task is cancelled meanwhile.
 
         Args:
             exc_type: The exception type.
             exc_value: The exception value.
             traceback: The traceback.
         """
-        if exc_type:
-            await self.rollback()
-        await self.close()
+        try:
+            if exc_type:
+                await self.rollback()
+        finally:
+            await self.close()
 
     async def close(self) -> None:
         """Close the database session.
 
         This method closes the underlying SQLAlchemy session.
+        And stops tracking the guilds it changes.
         """
+        if event.contains(self._session.sync_session, "before_flush", self._track_changed_guilds):
+            event.remove(self._session.sync_session, "before_flush", self._track_changed_guilds)
         await self._session.close()
 
     async def flush(self) -> None:
@@ -110,8 +241,13 @@ class OnlineConfig:
         """Commit the database session.
 
         Commits the underlying SQLAlchemy session.
+        Any guild changed by this session is dropped from the guild cache.
         """
         await self._session.commit()
+        if self._guild_cache is not None:
+            for guild_id in self._changed_guild_ids:
+                self._guild_cache.invalidate(guild_id)
+        self._changed_guild_ids.clear()
 
     async def rollback(self) -> None:
         """Rollback the database session.
@@ -120,6 +256,7 @@ class OnlineConfig:
         This includes the flushed changes.
         """
         await self._session.rollback()
+        self._changed_guild_ids.clear()
 
     async def delete(self, obj) -> None:
         """Delete a row from the database.
@@ -137,6 +274,8 @@ class OnlineConfig:
         we guarantee a guild will always be returned.
         It will be created if it does not exist.
         However, we do not commit the changes.
+        Without options, a guild already in this session or in the
+        guild cache is returned without querying the database.
 
         Args:
             guild_id: The guild ID.
@@ -150,16 +289,96 @@ class OnlineConfig:
                 Otherwise, attempting to access the relationships will
                 result in an error.
         """
+        if not options:
+            guild_conf = self._session.identity_map.get(_GUILD_MAPPER.identity_key_from_primary_key((guild_id,)))
+            if guild_conf is not None and not sqlalchemy.inspect(guild_conf).expired_attributes:
+                return guild_conf
+            snapshot = None
+            if self._guild_cache is not None and guild_id not in self._guild_ids:
+                snapshot = self._guild_cache.get(guild_id)
+            if snapshot is not None:
+                # Attach the cached row to this session without a query.
+                self._guild_ids.add(guild_id)
+                guild_conf = models.Guild(**snapshot)
+                orm.make_transient_to_detached(guild_conf)
+                guild_conf = await self._session.merge(guild_conf, load=False)
+                guild_conf.init_on_load()
+                return guild_conf
+        epoch = self._guild_cache.epoch(guild_id) if self._guild_cache is not None else 0
+        first_load = guild_id not in self._guild_ids
+        self._guild_ids.add(guild_id)
+        stmt = sql.select(models.Guild).where(models.Guild.guild_id == guild_id)
         if options:
-            guild_conf = await self._session.scalar(
-                sql.select(models.Guild).where(models.Guild.guild_id == guild_id).options(*options))
-        else:
-            guild_conf = await self._session.scalar(sql.select(models.Guild).where(models.Guild.guild_id == guild_id))
+            stmt = stmt.options(*options)
+        guild_conf = await self._session.scalar(stmt)
         if guild_conf is None:
             guild_conf = models.Guild(guild_id=guild_id)
             self._session.add(guild_conf)
+        elif self._guild_cache is not None and first_load and not self._session.is_modified(guild_conf):
+            self._guild_cache.put(guild_conf, epoch)
         return guild_conf
 
+    async def toggle_guild_flag(self, guild_id: int, flag: str) -> bool:
+        """Toggle a boolean guild setting.
+
+        Flips the flag with a single UPDATE ... RETURNING statement.
+        Only if the guild does not exist yet, it is created and
+        the flag is flipped in Python instead.
+        We do not commit the changes.
+
+        Args:
+            guild_id: The guild ID.
+            flag: The name of the boolean `models.Guild` column.
+
+        Returns:
+            bool: The new value of the flag.
+        """
+        column = getattr(models.Guild, flag)
+        self._guild_ids.add(guild_id)
+        # Bypasses the flush, so record the change ourselves.
+        self._changed_guild_ids.add(guild_id)
+        new_value = await self._session.scalar(
+            sql.update(models.Guild).where(models.Guild.guild_id == guild_id).values({
+                column: sql.not_(column)
+            }).returning(column))
+        if new_value is None:
+            guild = await self.get_guild(guild_id)
+            # Flush to apply the column defaults before flipping.
+            await self.flush()
+            new_value = not getattr(guild, flag)
+            setattr(guild, flag, new_value)
+        return new_value
+
+    async def toggle_role(
+        self,
+        model: Type[models.StaffRole | models.ObserversRole | models.CommunityRole | models.CommunityPing],
+        role_id: int,
+        guild_id: int,
+    ) -> bool:
+        """Add or remove a guild role entry.
+
+        Removes the entry with a single DELETE ... RETURNING statement.
+        Only if nothing was removed, the entry is created.
+        We also check if the guild exists and create it if it does not,
+        but only when the entry has to be created.
+        We do not commit the changes.
+
+        Args:
+            model: The role model to toggle the entry in.
+            role_id: The role ID.
+            guild_id: The guild ID.
+
+        Returns:
+            bool: Whether the entry was added.
+        """
+        removed = await self._session.scalar(
+            sql.delete(model).where(model.role_id == role_id, model.guild_id == guild_id).returning(model.role_id))
+        if removed is not None:
+            return False
+        guild = await self.get_guild(guild_id)
+        self._session.add(model(role_id=role_id, guild=guild))
+        return True
+
     async def get_user(self, user_id: int, options: Sequence[base.ExecutableOption] | None = None) -> models.User:
         """Get or create a user from the database.
 
@@ -185,7 +404,8 @@ class OnlineConfig:
             user = await self._session.scalar(
                 sql.select(models.User).where(models.User.user_id == user_id).options(*options))
         else:
-            user = await self._session.scalar(sql.select(models.User).where(models.User.user_id == user_id))
+            # Primary key lookup, answered from the identity map when possible.
+            user = await self._session.get(models.User, user_id)
         if user is None:
             user = models.User(user_id=user_id)
             self._session.add(user)
@@ -196,8 +416,10 @@ class OnlineConfig:
 
         Fetches a member from the database.
         If the member does not exist, it will be created.
-        We also check if the guild exists and create it if it does not.
-        We also check if the user exists and create it if it does not.
+        The member is looked up by its composite primary key, so
+        the identity map is consulted before the database.
+        We also check if the guild and user exist and create them if they
+        do not, but only when the member has to be created.
 
         Args:
             user_id: The user ID.
@@ -209,11 +431,10 @@ class OnlineConfig:
                 and a one-to-one relationship with users, we automatically
                 load the guild and user relationships.
         """
-        guild = await self.get_guild(guild_id)
-        user = await self.get_user(user_id)
-        member_conf = await self._session.scalar(
-            sql.select(models.Member).where(models.Member.user == user, models.Member.guild == guild))
+        member_conf = await self._session.get(models.Member, (user_id, guild_id))
         if member_conf is None:
+            guild = await self.get_guild(guild_id)
+            user = await self.get_user(user_id)
             member_conf = models.Member(user=user, guild=guild)
             self._session.add(member_conf)
         return member_conf
@@ -227,8 +448,8 @@ class OnlineConfig:
         Returns:
             Sequence[models.Member]: The members with expired status.
         """
-        time = datetime.datetime.utcnow()
-        expr_members = await self._session.scalars(sql.select(models.Member).where(models.Member.status_till <= time))
+        now = datetime.datetime.now(datetime.UTC).replace(tzinfo=None)
+        expr_members = await self._session.scalars(sql.select(models.Member).where(models.Member.status_till <= now))
         return expr_members.all()
 
     async def get_ticket_bot(self, user_id: int, guild_id: int) -> Tuple[bool, models.TicketBot]:
@@ -236,7 +457,9 @@ class OnlineConfig:
 
         Fetches a ticket bot from the database.
         If the ticket bot does not exist, it will be created.
-        We also check if the guild exists and create it if it does not.
+        The ticket bot is looked up by its composite primary key.
+        We also check if the guild exists and create it if it does not,
+        but only when the ticket bot has to be created.
 
         Args:
             user_id: The user ID.
@@ -245,14 +468,13 @@ class OnlineConfig:
         Returns:
             Tuple[bool, models.TicketBot]: A tuple containing a boolean
                 indicating if the ticket bot was created, and the ticket bot.
-                Relationships are loaded.
+                The guild relationship is not loaded.
         """
-        guild = await self.get_guild(guild_id)
-        ticket_user = await self._session.scalar(
-            sql.select(models.TicketBot).where(models.TicketBot.user_id == user_id, models.TicketBot.guild == guild))
+        ticket_user = await self._session.get(models.TicketBot, (user_id, guild_id))
         new = False
         if ticket_user is None:
             new = True
+            guild = await self.get_guild(guild_id)
             ticket_user = models.TicketBot(user_id=user_id, guild=guild)
             self._session.add(ticket_user)
         return new, ticket_user
@@ -273,9 +495,7 @@ class OnlineConfig:
         Returns:
             bool: A boolean indicating if the ticket user exists.
         """
-        ticket_user = await self._session.scalar(
-            sql.select(models.TicketBot).where(models.TicketBot.user_id == user_id,
-                                               models.TicketBot.guild_id == guild_id))
+        ticket_user = await self._session.get(models.TicketBot, (user_id, guild_id))
         return ticket_user is not None
 
     async def get_ticket_type(self,
@@ -289,7 +509,9 @@ class OnlineConfig:
 
         Fetches a ticket type from the database.
         If the ticket type does not exist, it will be created.
-        We also check if the guild exists and create it if it does not.
+        The ticket type is looked up by its composite primary key.
+        We also check if the guild exists and create it if it does not,
+        but only when the ticket type has to be created.
 
         Args:
             guild_id: The guild ID.
@@ -302,14 +524,13 @@ class OnlineConfig:
         Returns:
             Tuple[bool, models.TicketType]: A tuple containing a boolean
                 indicating if the ticket type was created, and the ticket type.
-                Relationships are loaded.
+                The guild relationship is not loaded.
         """
-        guild = await self.get_guild(guild_id)
-        ticket_type = await self._session.scalar(
-            sql.select(models.TicketType).where(models.TicketType.guild == guild, models.TicketType.prefix == name))
+        ticket_type = await self._session.get(models.TicketType, (name, guild_id))
         new = False
         if ticket_type is None:
             new = True
+            guild = await self.get_guild(guild_id)
             ticket_type = models.TicketType(guild=guild,
                                             prefix=name,
                                             comping=comping,
@@ -323,7 +544,7 @@ class OnlineConfig:
         """Get ticket types from the database.
 
         Fetches all ticket types from the database.
-        We also check if the guild exists and create it if it does not.
+        The guild row is not loaded, the types are filtered by guild ID.
 
         Args:
             guild_id: The guild ID.
@@ -331,9 +552,8 @@ class OnlineConfig:
         Returns:
             Sequence[models.TicketType]: The ticket types.
         """
-        guild = await self.get_guild(guild_id)
         ticket_types = await self._session.scalars(
-            sql.select(models.TicketType).where(models.TicketType.guild == guild))
+            sql.select(models.TicketType).where(models.TicketType.guild_id == guild_id))
         return ticket_types.all()
 
     async def fetch_ticket(self, channel_id: int) -> models.Ticket | None:
@@ -362,7 +582,8 @@ class OnlineConfig:
 
         Fetches a ticket from the database.
         If the ticket does not exist, it will be created.
-        We also check if the guild exists and create it if it does not.
+        We also check if the guild exists and create it if it does not,
+        but only when the ticket has to be created.
         If you want to check if a ticket exists, use fetch_ticket instead.
 
         Args:
@@ -377,11 +598,11 @@ class OnlineConfig:
                 indicating if the ticket was created, and the ticket.
                 Relationships are loaded.
         """
-        guild = await self.get_guild(guild_id)
         ticket = await self._session.get(models.Ticket, channel_id)
         new = False
         if ticket is None:
             new = True
+            guild = await self.get_guild(guild_id)
             ticket = models.Ticket(channel_id=channel_id, guild=guild, user_id=user_id, staff_note_thread=staff_note)
             self._session.add(ticket)
         return new, ticket
@@ -394,10 +615,7 @@ class OnlineConfig:
         Returns:
             Sequence[models.Ticket]: The pending tickets.
         """
-        tickets = await self._session.scalars(
-            sql.select(models.Ticket).join(models.Guild).filter(
-                models.Guild.warn_autoclose.isnot(None), models.Ticket.notified.isnot(True), models.Ticket.last_response
-                <= models.UTCnow() - models.Guild.warn_autoclose))
+        tickets = await self._session.scalars(_PENDING_TICKETS)
         return tickets.all()
 
     async def fetch_tag(self, guild_id: int, tag: str) -> discord.Embed | str | None:
@@ -415,9 +633,7 @@ class OnlineConfig:
         Returns:
             discord.Embed | str | None: The tag.
         """
-        guild = await self.get_guild(guild_id)
-        embed = await self._session.scalar(
-            sql.select(models.Tag).where(models.Tag.guild == guild, models.Tag.tag_name == tag))
+        embed = await self._session.get(models.Tag, (guild_id, tag))
         if embed is None:
             return None
         if embed.title:
@@ -446,7 +662,8 @@ class OnlineConfig:
 
         Fetches a tag from the database.
         If the tag does not exist, it will be created.
-        We also check if the guild exists and create it if it does not.
+        We also check if the guild exists and create it if it does not,
+        but only when the tag has to be created.
         If you want to check if a tag exists, use fetch_tag instead.
 
         Args:
@@ -457,12 +674,11 @@ class OnlineConfig:
                 Basically, the arguments to pass to discord.Embed,
                 when using discord.Embed.from_dict.
         """
-        guild = await self.get_guild(guild_id)
-        tag = await self._session.scalar(
-            sql.select(models.Tag).where(models.Tag.guild == guild, models.Tag.tag_name == tag_name))
+        tag = await self._session.get(models.Tag, (guild_id, tag_name))
         new = False
         if tag is None:
             new = True
+            guild = await self.get_guild(guild_id)
             if embed_args is None:
                 embed_args = {}
             tag = models.Tag(guild=guild, tag_name=tag_name, description=description, **embed_args)
@@ -473,7 +689,7 @@ class OnlineConfig:
         """Get tags from the database.
 
         Fetches all tags from the database.
-        We also check if the guild exists and create it if it does not.
+        The guild row is not loaded, the tags are filtered by guild ID.
 
         Args:
             guild_id: The guild ID.
@@ -481,8 +697,7 @@ class OnlineConfig:
         Returns:
             Sequence[models.Tag]: The tags.
         """
-        guild = await self.get_guild(guild_id)
-        tags = await self._session.scalars(sql.select(models.Tag).where(models.Tag.guild == guild))
+        tags = await self._session.scalars(sql.select(models.Tag).where(models.Tag.guild_id == guild_id))
         return tags.all()
 
     async def get_staff_role(self, role_id: int, guild_id: int) -> Tuple[bool, models.StaffRole]:
@@ -490,7 +705,8 @@ class OnlineConfig:
 
         Fetches a staff role from the database.
         If the staff role does not exist, it will be created.
-        We also check if the guild exists and create it if it does not.
+        We also check if the guild exists and create it if it does not,
+        but only when the role has to be created.
 
         Args:
             role_id: The role ID.
@@ -499,13 +715,13 @@ class OnlineConfig:
         Returns:
             Tuple[bool, models.StaffRole]: A tuple containing a boolean
                 indicating if the staff role was created, and the staff role.
-                Relationships are loaded.
+                The guild relationship is not loaded.
         """
-        guild = await self.get_guild(guild_id)
         staff_role = await self._session.get(models.StaffRole, role_id)
         new = False
         if staff_role is None:
             new = True
+            guild = await self.get_guild(guild_id)
             staff_role = models.StaffRole(role_id=role_id, guild=guild)
             self._session.add(staff_role)
         return new, staff_role
@@ -515,16 +731,17 @@ class OnlineConfig:
 
         Fetches all staff roles from the database.
         If the staff roles do not exist, an empty list is returned.
+        The guild row is not loaded, the rows are filtered by guild ID.
 
         Args:
             guild_id: The guild ID.
 
         Returns:
             Sequence[models.StaffRole]: A list of staff roles.
-                Relationships are loaded.
+                The guild relationship is not loaded.
         """
-        guild = await self.get_guild(guild_id)
-        staff_roles = await self._session.scalars(sql.select(models.StaffRole).where(models.StaffRole.guild == guild))
+        staff_roles = await self._session.scalars(
+            sql.select(models.StaffRole).where(models.StaffRole.guild_id == guild_id))
         return staff_roles.all()
 
     async def check_staff_role(self, role_id: int) -> bool:
@@ -548,7 +765,8 @@ class OnlineConfig:
 
         Fetches an observer role from the database.
         If the observer role does not exist, it will be created.
-        We also check if the guild exists and create it if it does not.
+        We also check if the guild exists and create it if it does not,
+        but only when the role has to be created.
 
         Args:
             role_id: The role ID.
@@ -557,13 +775,13 @@ class OnlineConfig:
         Returns:
             Tuple[bool, models.ObserversRole]: A tuple containing a boolean
                 indicating if the observer role was created, and the observers'
-                role. Relationships are loaded.
+                role. The guild relationship is not loaded.
         """
-        guild = await self.get_guild(guild_id)
         observers_role = await self._session.get(models.ObserversRole, role_id)
         new = False
         if observers_role is None:
             new = True
+            guild = await self.get_guild(guild_id)
             observers_role = models.ObserversRole(role_id=role_id, guild=guild)
             self._session.add(observers_role)
         return new, observers_role
@@ -573,17 +791,17 @@ class OnlineConfig:
 
         Fetches all observer roles from the database.
         If the observer roles do not exist, an empty list is returned.
+        The guild row is not loaded, the rows are filtered by guild ID.
 
         Args:
             guild_id: The guild ID.
 
         Returns:
             Sequence[models.ObserversRole]: A list of observer roles.
-                Relationships are loaded.
+                The guild relationship is not loaded.
         """
-        guild = await self.get_guild(guild_id)
         observers_roles = await self._session.scalars(
-            sql.select(models.ObserversRole).where(models.ObserversRole.guild == guild))
+            sql.select(models.ObserversRole).where(models.ObserversRole.guild_id == guild_id))
         return observers_roles.all()
 
     async def check_observers_role(self, role_id: int) -> bool:
@@ -607,7 +825,8 @@ class OnlineConfig:
 
         Fetches a community role from the database.
         If the community role does not exist, it will be created.
-        We also check if the guild exists and create it if it does not.
+        We also check if the guild exists and create it if it does not,
+        but only when the role has to be created.
 
         Args:
             role_id: The role ID.
@@ -616,13 +835,13 @@ class OnlineConfig:
         Returns:
             Tuple[bool, models.CommunityRole]: A tuple containing a boolean
                 indicating if the community role was created, and the community
-                role. Relationships are loaded.
+                role. The guild relationship is not loaded.
         """
-        guild = await self.get_guild(guild_id)
         community_role = await self._session.get(models.CommunityRole, role_id)
         new = False
         if community_role is None:
             new = True
+            guild = await self.get_guild(guild_id)
             community_role = models.CommunityRole(role_id=role_id, guild=guild)
             self._session.add(community_role)
         return new, community_role
@@ -632,17 +851,17 @@ class OnlineConfig:
 
         Fetches all community roles from the database.
         If the community roles do not exist, an empty list is returned.
+        The guild row is not loaded, the rows are filtered by guild ID.
 
         Args:
             guild_id: The guild ID.
 
         Returns:
             Sequence[models.CommunityRole]: A list of community roles.
-                Relationships are loaded.
+                The guild relationship is not loaded.
         """
-        guild = await self.get_guild(guild_id)
         community_roles = await self._session.scalars(
-            sql.select(models.CommunityRole).where(models.CommunityRole.guild == guild))
+            sql.select(models.CommunityRole).where(models.CommunityRole.guild_id == guild_id))
         return community_roles.all()
 
     async def check_community_role(self, role_id: int) -> bool:
@@ -666,7 +885,8 @@ class OnlineConfig:
 
         Fetches a community ping from the database.
         If the community ping does not exist, it will be created.
-        We also check if the guild exists and create it if it does not.
+        We also check if the guild exists and create it if it does not,
+        but only when the role has to be created.
 
         Args:
             role_id: The role ID.
@@ -675,13 +895,13 @@ class OnlineConfig:
         Returns:
             Tuple[bool, models.CommunityPing]: A tuple containing a boolean
                 indicating if the community ping was created, and the community
-                pings. Relationships are loaded.
+                pings. The guild relationship is not loaded.
         """
-        guild = await self.get_guild(guild_id)
         community_ping = await self._session.get(models.CommunityPing, role_id)
         new = False
         if community_ping is None:
             new = True
+            guild = await self.get_guild(guild_id)
             community_ping = models.CommunityPing(role_id=role_id, guild=guild)
             self._session.add(community_ping)
         return new, community_ping
@@ -691,17 +911,17 @@ class OnlineConfig:
 
         Fetches all community pings from the database.
         If the community pings do not exist, an empty list is returned.
+        The guild row is not loaded, the rows are filtered by guild ID.
 
         Args:
             guild_id: The guild ID.
 
         Returns:
             Sequence[models.CommunityPing]: A list of community pings.
-                Relationships are loaded.
+                The guild relationship is not loaded.
         """
-        guild = await self.get_guild(guild_id)
         community_pings = await self._session.scalars(
-            sql.select(models.CommunityPing).where(models.CommunityPing.guild == guild))
+            sql.select(models.CommunityPing).where(models.CommunityPing.guild_id == guild_id))
         return community_pings.all()
 
     async def check_community_ping(self, role_id: int) -> bool:
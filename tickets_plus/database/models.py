@@ -243,7 +243,7 @@ class TicketBot(Base):
     )
 
     # Relationships
-    guild: orm.Mapped["Guild"] = orm.relationship(back_populates="ticket_bots", lazy="selectin")
+    guild: orm.Mapped["Guild"] = orm.relationship(back_populates="ticket_bots", lazy="raise")
 
 
 class TicketType(Base):
@@ -295,7 +295,7 @@ class TicketType(Base):
                                                  comment="Whether to ignore this ticket type")
 
     # Relationships
-    guild: orm.Mapped["Guild"] = orm.relationship(back_populates="ticket_types", lazy="selectin")
+    guild: orm.Mapped["Guild"] = orm.relationship(back_populates="ticket_types", lazy="raise")
 
     @classmethod
     def default(cls: Type["TicketType"]) -> "TicketType":
@@ -338,6 +338,7 @@ class Ticket(Base):
         sqlalchemy.BigInteger(),
         sqlalchemy.ForeignKey("general_configs.guild_id"),
         nullable=False,
+        index=True,
         comment="Unique Guild ID of parent guild",
     )
     user_id: orm.Mapped[int | None] = orm.mapped_column(
@@ -447,7 +448,7 @@ class Tag(Base):
     # Relationships
     guild: orm.Mapped["Guild"] = orm.relationship(
         back_populates="tags",
-        lazy="selectin",
+        lazy="raise",
     )
 
 
@@ -482,11 +483,12 @@ class StaffRole(Base):
         sqlalchemy.BigInteger(),
         sqlalchemy.ForeignKey("general_configs.guild_id"),
         nullable=False,
+        index=True,
         comment="Unique Guild ID of parent guild",
     )
 
     # Relationships
-    guild: orm.Mapped["Guild"] = orm.relationship(back_populates="staff_roles", lazy="selectin")
+    guild: orm.Mapped["Guild"] = orm.relationship(back_populates="staff_roles", lazy="raise")
 
     # SNOWFLAKE PROTOCOL
     @orm.reconstructor
@@ -527,11 +529,12 @@ class ObserversRole(Base):
         sqlalchemy.BigInteger(),
         sqlalchemy.ForeignKey("general_configs.guild_id"),
         nullable=False,
+        index=True,
         comment="Unique Guild ID of parent guild",
     )
 
     # Relationships
-    guild: orm.Mapped["Guild"] = orm.relationship(back_populates="observers_roles", lazy="selectin")
+    guild: orm.Mapped["Guild"] = orm.relationship(back_populates="observers_roles", lazy="raise")
 
     # SNOWFLAKE PROTOCOL
     @orm.reconstructor
@@ -572,11 +575,12 @@ class CommunityRole(Base):
         sqlalchemy.BigInteger(),
         sqlalchemy.ForeignKey("general_configs.guild_id"),
         nullable=False,
+        index=True,
         comment="Unique Guild ID of parent guild",
     )
 
     # Relationships
-    guild: orm.Mapped["Guild"] = orm.relationship(back_populates="community_roles", lazy="selectin")
+    guild: orm.Mapped["Guild"] = orm.relationship(back_populates="community_roles", lazy="raise")
 
     # SNOWFLAKE PROTOCOL
     @orm.reconstructor
@@ -621,11 +625,12 @@ class CommunityPing(Base):
         sqlalchemy.BigInteger(),
         sqlalchemy.ForeignKey("general_configs.guild_id"),
         nullable=False,
+        index=True,
         comment="Unique Guild ID of parent guild",
     )
 
     # Relationships
-    guild: orm.Mapped["Guild"] = orm.relationship(back_populates="community_pings", lazy="selectin")
+    guild: orm.Mapped["Guild"] = orm.relationship(back_populates="community_pings", lazy="raise")
 
     # SNOWFLAKE PROTOCOL
     @orm.reconstructor
@@ -64,12 +64,8 @@ def is_owner_check():
                 Raised if the user is not an owner. This is according to the
                 discord.py convention.
         """
-        app = await interaction.client.application_info()
-        if app.team:
-            # Split to avoid errors ie AttributeError
-            if interaction.user in app.team.members:
-                return True
-        if interaction.user == app.owner:
+        # The bot caches the owner ids after the first lookup.
+        if await interaction.client.is_owner(interaction.user):  # type: ignore
             return True
         raise exceptions.TicketsCheckFailure("You do not have permission to do this.")
 
@@ -111,20 +107,15 @@ def is_staff_check():
         """
         if interaction.guild is None:
             return False
-        app = await interaction.client.application_info()
-        if app.team:
-            # Bot owners are always staff, split to avoid errors
-            if interaction.user in app.team.members:
-                return True
-        if interaction.user == app.owner:
+        if await interaction.client.is_owner(interaction.user):  # type: ignore
+            # Bot owners are always staff
             return True
         async with interaction.client.get_connection() as conn:  # type: ignore
             staff_roles = await conn.get_all_staff_roles(interaction.guild_id)
-            for role in staff_roles:
-                parsed_role = interaction.guild.get_role(role.role_id)
-                if parsed_role in interaction.user.roles:  # type: ignore
-                    # Already checked for member
-                    return True
+        staff_ids = frozenset(role.role_id for role in staff_roles)
+        # Already checked for member
+        if any(role.id in staff_ids for role in interaction.user.roles):  # type: ignore
+            return True
         raise exceptions.TicketsCheckFailure("You do not have"
                                              " permission to do this here.")
 